@@ -1,12 +1,96 @@
+import json
 import logging
-from typing import Any, Dict, List
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 import boto3
-from botocore.exceptions import ClientError
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of concurrent get_foundation_model_availability calls
+AVAILABILITY_CHECK_WORKERS = 16
+# Number of concurrent offer lookups / agreement creations
+ACTIVATION_WORKERS = 8
+# Size of the shared Bedrock client's HTTP connection pool
+MAX_POOL_CONNECTIONS = 64
+
+# Directory holding per-account, per-region caches of models known to be accessible
+AVAILABILITY_CACHE_DIR = Path.home() / '.cache' / 'bedrock_activator'
+# Seconds an accessible model is trusted without re-checking its availability
+AVAILABILITY_CACHE_TTL = 24 * 60 * 60
+
+# Error codes that indicate a transient failure rather than a problem with the model
+TRANSIENT_ERROR_CODES = frozenset({
+    'ThrottlingException',
+    'TooManyRequestsException',
+    'ServiceUnavailableException',
+    'InternalServerException',
+})
+
+# Bit assigned to each inference type in ModelRec.inference_mask
+INFERENCE_TYPE_BITS = {
+    'ON_DEMAND': 1,
+    'INFERENCE_PROFILE': 2,
+    'PROVISIONED': 4,
+}
+# Inference types that can be activated through model access
+ACTIVATABLE_INFERENCE_MASK = INFERENCE_TYPE_BITS['ON_DEMAND'] | INFERENCE_TYPE_BITS['INFERENCE_PROFILE']
+
+
+@cache
+def _get_session() -> boto3.session.Session:
+    """
+    Get the boto3 session shared by all activators
+
+    Service model data loaded for one client is reused by the next, e.g. when
+    activators are created for several regions in one run.
+
+    Returns:
+        The shared boto3 session, created on first use
+    """
+    return boto3.session.Session()
+
+
+@dataclass(slots=True)
+class ModelRec:
+    """
+    The fields of a foundation model summary used for activation
+    """
+    model_id: str
+    model_name: str
+    inference_types: tuple[str, ...]
+    inference_mask: int
+    lifecycle_status: str
+
+    @classmethod
+    def from_summary(cls, summary: Dict[str, Any]) -> 'ModelRec':
+        """
+        Build a record from a list_foundation_models model summary
+
+        Args:
+            summary: Model summary from the list_foundation_models response
+
+        Returns:
+            Record holding only the fields the activator reads
+        """
+        inference_types = tuple(summary.get('inferenceTypesSupported') or ())
+        return cls(
+            model_id=summary.get('modelId'),
+            model_name=summary.get('modelName', 'Unknown'),
+            inference_types=inference_types,
+            inference_mask=sum(INFERENCE_TYPE_BITS.get(t, 0) for t in set(inference_types)),
+            lifecycle_status=summary.get('modelLifecycle', {}).get('status', 'UNKNOWN')
+        )
+
+
 class BedrockModelActivator:
     def __init__(self, region_name: str = 'us-east-1'):
         """
@@ -16,97 +100,268 @@ class BedrockModelActivator:
             region_name: AWS region to use for Bedrock operations
         """
         self.region_name = region_name
-        self.bedrock_client = boto3.client('bedrock', region_name=region_name)
+        # A single client is shared by all worker threads; its connection pool must be
+        # at least as large as the number of workers or requests queue for a connection
+        self.bedrock_client = _get_session().client(
+            'bedrock',
+            region_name=region_name,
+            config=Config(
+                max_pool_connections=MAX_POOL_CONNECTIONS,
+                retries={'mode': 'adaptive', 'max_attempts': 10},
+                tcp_keepalive=True
+            )
+        )
+        # Counts from the last listing pass; only complete once the iterators are exhausted
+        self.listing_counts = {'total': 0, 'legacy': 0, 'eligible': 0}
+        self._avail_cache_path = self._availability_cache_path()
+        self._avail_cache = self._load_availability_cache() if self._avail_cache_path else {}
+
+    def _availability_cache_path(self) -> Optional[Path]:
+        """
+        Get the availability cache file for the caller's account and region
+
+        Model access belongs to an AWS account, so the cache is disabled when the
+        account cannot be determined.
+
+        Returns:
+            Path of the cache file, or None if the cache is disabled
+        """
+        try:
+            sts_client = _get_session().client('sts', region_name=self.region_name)
+            account_id = sts_client.get_caller_identity()['Account']
+        except (BotoCoreError, ClientError, KeyError) as e:
+            logger.warning("Availability cache disabled, could not determine AWS account: %s", e)
+            return None
+
+        return AVAILABILITY_CACHE_DIR / account_id / f"{self.region_name}.json"
+
+    def _load_availability_cache(self) -> Dict[str, float]:
+        """
+        Load the availability cache for this account and region from disk
 
-    def list_foundation_models(self) -> List[Dict[str, Any]]:
+        Returns:
+            Mapping of model ID to the time it was last seen accessible
         """
-        List all available foundation models
+        try:
+            with open(self._avail_cache_path, encoding='utf-8') as f:
+                cache = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable availability cache %s: %s", self._avail_cache_path, e)
+            return {}
+
+        if not isinstance(cache, dict):
+            logger.warning("Ignoring unreadable availability cache %s: not a JSON object", self._avail_cache_path)
+            return {}
+
+        valid_cache = {
+            model_id: cached_at for model_id, cached_at in cache.items()
+            if isinstance(cached_at, (int, float)) and not isinstance(cached_at, bool)
+        }
+        if len(valid_cache) != len(cache):
+            logger.warning(
+                "Ignoring %s invalid entries in availability cache %s",
+                len(cache) - len(valid_cache), self._avail_cache_path
+            )
+
+        return self._prune_availability_cache(valid_cache)
+
+    @staticmethod
+    def _prune_availability_cache(cache: Dict[str, float]) -> Dict[str, float]:
+        """
+        Drop availability cache entries older than AVAILABILITY_CACHE_TTL
+
+        Args:
+            cache: Mapping of model ID to the time it was last seen accessible
 
         Returns:
-            List of foundation model summaries
+            Mapping containing only the entries that are still fresh
+        """
+        now = time.time()
+        return {
+            model_id: cached_at for model_id, cached_at in cache.items()
+            if 0 <= now - cached_at < AVAILABILITY_CACHE_TTL
+        }
+
+    def _save_availability_cache(self):
         """
+        Persist the availability cache for this account and region to disk
+        """
+        if self._avail_cache_path is None:
+            return
+
+        try:
+            self._avail_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._avail_cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self._prune_availability_cache(self._avail_cache), f)
+        except OSError as e:
+            logger.warning("Could not save availability cache %s: %s", self._avail_cache_path, e)
+
+    def iter_foundation_models(self) -> Iterator[ModelRec]:
+        """
+        Iterate over all available foundation models
+
+        Updates listing_counts['total'] as models are yielded.
+
+        Yields:
+            Foundation model records
+        """
+        self.listing_counts['total'] = 0
         try:
             logger.info("Retrieving list of foundation models...")
-            response = self.bedrock_client.list_foundation_models()
-            models = response.get('modelSummaries', [])
-            logger.info(f"Found {len(models)} foundation models")
-            return models
+            if self.bedrock_client.can_paginate('list_foundation_models'):
+                paginator = self.bedrock_client.get_paginator('list_foundation_models')
+                pages = (page.get('modelSummaries', []) for page in paginator.paginate())
+            else:
+                pages = [self.bedrock_client.list_foundation_models().get('modelSummaries', [])]
+
+            for summaries in pages:
+                for summary in summaries:
+                    self.listing_counts['total'] += 1
+                    yield ModelRec.from_summary(summary)
         except ClientError as e:
-            logger.error(f"Error listing foundation models: {e}")
+            logger.error("Error listing foundation models: %s", e)
             raise
 
-    def filter_on_demand_models(self, models: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def iter_on_demand_models(self, models: Iterable[ModelRec]) -> Iterator[ModelRec]:
         """
-        Filter models to only include those supporting ON_DEMAND or INFERENCE_PROFILE
+        Lazily filter models to only include those supporting ON_DEMAND or INFERENCE_PROFILE
+        that are not in the LEGACY lifecycle status
+
+        Updates listing_counts['legacy'] and listing_counts['eligible'] as models are consumed.
 
         Args:
-            models: List of model summaries from list_foundation_models
+            models: Model records from iter_foundation_models
 
-        Returns:
-            List of filtered models supporting ON_DEMAND or INFERENCE_PROFILE
+        Yields:
+            Active models supporting ON_DEMAND or INFERENCE_PROFILE
         """
-        filtered_models = []
-
+        self.listing_counts['legacy'] = 0
+        self.listing_counts['eligible'] = 0
         for model in models:
-            model_id = model.get('modelId')
-            inference_types = model.get('inferenceTypesSupported', [])
+            # Legacy models are being retired, so there is no point in checking their access
+            if model.lifecycle_status == 'LEGACY':
+                logger.info("Skipping model %s - lifecycle status is LEGACY", model.model_id)
+                self.listing_counts['legacy'] += 1
+                continue
 
             # Check if model supports ON_DEMAND or INFERENCE_PROFILE
-            if any(inference_type in ['ON_DEMAND', 'INFERENCE_PROFILE']
-                   for inference_type in inference_types):
-                filtered_models.append(model)
-                logger.info(f"Model {model_id} supports: {inference_types}")
+            if model.inference_mask & ACTIVATABLE_INFERENCE_MASK:
+                logger.info("Model %s supports: %s", model.model_id, model.inference_types)
+                self.listing_counts['eligible'] += 1
+                yield model
             else:
-                logger.info(f"Skipping model {model_id} - unsupported inference types: {inference_types}")
-
-        logger.info(f"Filtered to {len(filtered_models)} ON_DEMAND/INFERENCE_PROFILE models")
-        return filtered_models
+                logger.info("Skipping model %s - unsupported inference types: %s", model.model_id, model.inference_types)
 
-    def check_model_access_status(self, models: List[Dict[str, Any]]) -> tuple[
-        List[Dict], List[Dict]
+    def check_model_access_status(self, models: Iterable[ModelRec]) -> tuple[
+        List[ModelRec], List[ModelRec]
     ]:
         """
         Check which models need access requests using get_foundation_model_availability API
 
+        Availability checks are submitted as models are consumed, so a lazy iterable
+        lets the checks overlap with listing and filtering. Models whose availability
+        could not be determined because of a transient error are left out of both lists.
+
         Args:
-            models: List of model summaries from list_foundation_models
+            models: Model records, e.g. from iter_on_demand_models
 
         Returns:
             Tuple of (accessible_models, models_needing_access)
         """
         accessible_models = []
         models_needing_access = []
+        unchecked_models = 0
+
+        with ThreadPoolExecutor(max_workers=AVAILABILITY_CHECK_WORKERS) as executor:
+            futures = {
+                executor.submit(self._needs_access, model): model
+                for model in models
+            }
+            # Collect in submission order so the results follow the listing order
+            for future, model in futures.items():
+                needs_access = future.result()
+                if needs_access is None:
+                    unchecked_models += 1
+                elif needs_access:
+                    models_needing_access.append(model)
+                else:
+                    accessible_models.append(model)
 
-        for model in models:
-            model_id = model.get('modelId')
+        logger.info("Accessible models: %s", len(accessible_models))
+        logger.info("Models needing access: %s", len(models_needing_access))
+        if unchecked_models:
+            logger.warning("Models skipped after transient availability errors: %s", unchecked_models)
 
-            try:
-                logger.info(f"Checking availability for model: {model_id}")
-                response = self.bedrock_client.get_foundation_model_availability(
-                    modelId=model_id
-                )
+        return accessible_models, models_needing_access
 
-                agreement_availability = response.get('agreementAvailability', {})
-                agreement_status = agreement_availability.get('status', 'UNKNOWN')
-                authorization_status = response.get('authorizationStatus', 'UNKNOWN')
+    def _needs_access(self, model: ModelRec) -> Optional[bool]:
+        """
+        Check whether a single model needs an access request
 
-                logger.info(f"Model {model_id}: agreement={agreement_status}, authorization={authorization_status}")
+        Args:
+            model: Model record from iter_foundation_models
 
-                # Models that need activation have agreementAvailability.status == 'NOT_AVAILABLE'
-                if agreement_status == 'NOT_AVAILABLE':
-                    models_needing_access.append(model)
-                else:
-                    accessible_models.append(model)
+        Returns:
+            True if the model needs access, False if it is already accessible,
+            None if the check failed with a transient error
+        """
+        model_id = model.model_id
 
-            except ClientError as e:
-                logger.error(f"Error checking availability for {model_id}: {e}")
-                # If we can't check, assume it needs access
-                models_needing_access.append(model)
+        # Accessible models rarely lose access, so a recent positive result is trusted
+        cached_at = self._avail_cache.get(model_id)
+        if cached_at is not None and 0 <= time.time() - cached_at < AVAILABILITY_CACHE_TTL:
+            logger.info("Model %s: accessible (cached)", model_id)
+            return False
 
-        logger.info(f"Accessible models: {len(accessible_models)}")
-        logger.info(f"Models needing access: {len(models_needing_access)}")
+        try:
+            logger.info("Checking availability for model: %s", model_id)
+            response = self.bedrock_client.get_foundation_model_availability(
+                modelId=model_id
+            )
 
-        return accessible_models, models_needing_access
+            agreement_availability = response.get('agreementAvailability', {})
+            agreement_status = agreement_availability.get('status', 'UNKNOWN')
+            authorization_status = response.get('authorizationStatus', 'UNKNOWN')
+
+            logger.info("Model %s: agreement=%s, authorization=%s", model_id, agreement_status, authorization_status)
+
+            # Models that need activation have agreementAvailability.status == 'NOT_AVAILABLE'
+            if agreement_status == 'NOT_AVAILABLE':
+                return True
+
+            # Only a confirmed AVAILABLE status is cached; ERROR, PENDING or a missing status
+            # is treated as accessible for this run but checked again next time
+            if agreement_status == 'AVAILABLE':
+                self._avail_cache[model_id] = time.time()
+            return False
+
+        except ClientError as e:
+            # Throttling and 5xx errors have already been retried with backoff by the
+            # client's adaptive retry mode; requesting access now would fail the same way
+            if self._is_transient_error(e):
+                logger.warning("Skipping %s after transient availability error: %s", model_id, e)
+                return None
+
+            logger.error("Error checking availability for %s: %s", model_id, e)
+            # If we can't check, assume it needs access
+            return True
+
+    @staticmethod
+    def _is_transient_error(error: ClientError) -> bool:
+        """
+        Check whether a ClientError is a throttling or server-side error
+
+        Args:
+            error: The error raised by the Bedrock client
+
+        Returns:
+            True if the error is transient, False otherwise
+        """
+        code = error.response.get('Error', {}).get('Code')
+        status = error.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0)
+        return code in TRANSIENT_ERROR_CODES or status >= 500
 
     def get_agreement_offers(self, model_id: str) -> List[Dict[str, Any]]:
         """
@@ -119,15 +374,15 @@ class BedrockModelActivator:
             List of offer details
         """
         try:
-            logger.info(f"Getting agreement offers for model: {model_id}")
+            logger.info("Getting agreement offers for model: %s", model_id)
             response = self.bedrock_client.list_foundation_model_agreement_offers(
                 modelId=model_id
             )
             offers = response.get('offers', [])
-            logger.info(f"Found {len(offers)} offers for model {model_id}")
+            logger.info("Found %s offers for model %s", len(offers), model_id)
             return offers
         except ClientError as e:
-            logger.error(f"Error getting agreement offers for {model_id}: {e}")
+            logger.error("Error getting agreement offers for %s: %s", model_id, e)
             return []
 
     def create_model_agreement(self, model_id: str, offer_token: str) -> bool:
@@ -142,15 +397,15 @@ class BedrockModelActivator:
             True if successful, False otherwise
         """
         try:
-            logger.info(f"Creating model agreement for {model_id}")
+            logger.info("Creating model agreement for %s", model_id)
             self.bedrock_client.create_foundation_model_agreement(
                 modelId=model_id,
                 offerToken=offer_token
             )
-            logger.info(f"Successfully created agreement for model {model_id}")
+            logger.info("Successfully created agreement for model %s", model_id)
             return True
         except ClientError as e:
-            logger.error(f"Error creating agreement for {model_id}: {e}")
+            logger.error("Error creating agreement for %s: %s", model_id, e)
             return False
 
     def activate_all_models(self) -> Dict[str, Any]:
@@ -160,84 +415,110 @@ class BedrockModelActivator:
         Returns:
             Summary of activation results
         """
-        logger.info(f"Starting model activation process in region: {self.region_name}")
-
-        # Step 1: List all foundation models
-        all_models = self.list_foundation_models()
-
-        # Step 2: Filter to ON_DEMAND and INFERENCE_PROFILE models only
-        filtered_models = self.filter_on_demand_models(all_models)
+        logger.info("Starting model activation process in region: %s", self.region_name)
 
-        # Step 3: Check which models need access
-        accessible_models, models_needing_access = self.check_model_access_status(filtered_models)
+        # Steps 1-3 run as a single pass: models are listed, filtered to ON_DEMAND and
+        # INFERENCE_PROFILE, and submitted for availability checks as they stream through
+        try:
+            accessible_models, models_needing_access = self.check_model_access_status(
+                self.iter_on_demand_models(self.iter_foundation_models())
+            )
+        finally:
+            self._save_availability_cache()
+
+        # check_model_access_status has consumed both iterators, so the counts are final
+        total_models = self.listing_counts['total']
+        legacy_models = self.listing_counts['legacy']
+        filtered_models = self.listing_counts['eligible']
+        logger.info(
+            "Listed %s foundation models, %s LEGACY skipped, %s eligible (ON_DEMAND/INFERENCE_PROFILE)",
+            total_models, legacy_models, filtered_models
+        )
 
         # Step 4 & 5: For models needing access, get offers and create agreements
         activation_results = {
-            'total_models': len(all_models),
-            'filtered_models': len(filtered_models),
+            'total_models': total_models,
+            'legacy_models': legacy_models,
+            'filtered_models': filtered_models,
             'already_accessible': len(accessible_models),
+            'unchecked': filtered_models - len(accessible_models) - len(models_needing_access),
             'attempted_activation': len(models_needing_access),
             'successful_activations': 0,
             'failed_activations': 0,
             'activation_details': []
         }
 
-        for model in models_needing_access:
-            model_id = model.get('modelId')
-            model_name = model.get('modelName', 'Unknown')
-
-            logger.info(f"Processing model: {model_name} ({model_id})")
+        with ThreadPoolExecutor(max_workers=ACTIVATION_WORKERS) as executor:
+            futures = [
+                executor.submit(self._activate_one, model)
+                for model in models_needing_access
+            ]
+            for future in as_completed(futures):
+                if future.result()['status'] == 'success':
+                    activation_results['successful_activations'] += 1
+                else:
+                    activation_results['failed_activations'] += 1
 
-            # Get agreement offers for this model
-            offers = self.get_agreement_offers(model_id)
+        # Report details in submission order rather than completion order
+        activation_results['activation_details'] = [future.result() for future in futures]
 
-            if not offers:
-                logger.warning(f"No offers found for model {model_id}")
-                activation_results['failed_activations'] += 1
-                activation_results['activation_details'].append({
-                    'model_id': model_id,
-                    'model_name': model_name,
-                    'status': 'failed',
-                    'reason': 'no_offers_available'
-                })
-                continue
+        return activation_results
 
-            # Try to create agreement with the first available offer
-            offer = offers[0]
-            offer_token = offer.get('offerToken')
-
-            if not offer_token:
-                logger.warning(f"No offer token found for model {model_id}")
-                activation_results['failed_activations'] += 1
-                activation_results['activation_details'].append({
-                    'model_id': model_id,
-                    'model_name': model_name,
-                    'status': 'failed',
-                    'reason': 'no_offer_token'
-                })
-                continue
+    def _activate_one(self, model: ModelRec) -> Dict[str, Any]:
+        """
+        Get agreement offers for a single model and create its agreement
 
-            # Create the model agreement
-            success = self.create_model_agreement(model_id, offer_token)
-
-            if success:
-                activation_results['successful_activations'] += 1
-                activation_results['activation_details'].append({
-                    'model_id': model_id,
-                    'model_name': model_name,
-                    'status': 'success',
-                    'offer_token': offer_token
-                })
-            else:
-                activation_results['failed_activations'] += 1
-                activation_results['activation_details'].append({
-                    'model_id': model_id,
-                    'model_name': model_name,
-                    'status': 'failed',
-                    'reason': 'agreement_creation_failed'
-                })
+        Args:
+            model: Record of a model needing access
 
-        return activation_results
+        Returns:
+            Activation detail record for the model
+        """
+        model_id = model.model_id
+        model_name = model.model_name
+
+        logger.info("Processing model: %s (%s)", model_name, model_id)
+
+        # Get agreement offers for this model
+        offers = self.get_agreement_offers(model_id)
+
+        if not offers:
+            logger.warning("No offers found for model %s", model_id)
+            return {
+                'model_id': model_id,
+                'model_name': model_name,
+                'status': 'failed',
+                'reason': 'no_offers_available'
+            }
+
+        # Try to create agreement with the first available offer
+        offer = offers[0]
+        offer_token = offer.get('offerToken')
+
+        if not offer_token:
+            logger.warning("No offer token found for model %s", model_id)
+            return {
+                'model_id': model_id,
+                'model_name': model_name,
+                'status': 'failed',
+                'reason': 'no_offer_token'
+            }
+
+        # Create the model agreement
+        if self.create_model_agreement(model_id, offer_token):
+            return {
+                'model_id': model_id,
+                'model_name': model_name,
+                'status': 'success',
+                'offer_token': offer_token
+            }
+
+        return {
+            'model_id': model_id,
+            'model_name': model_name,
+            'status': 'failed',
+            'reason': 'agreement_creation_failed'
+        }
 
     def print_summary(self, results: Dict[str, Any]):
         """
@@ -246,27 +527,36 @@ class BedrockModelActivator:
         Args:
             results: Results dictionary from activate_all_models
         """
-        print("\n" + "="*50)
-        print("BEDROCK MODEL ACTIVATION SUMMARY")
-        print("="*50)
-        print(f"Region: {self.region_name}")
-        print(f"Total models found: {results['total_models']}")
-        print(f"Filtered models (ON_DEMAND/INFERENCE_PROFILE): {results['filtered_models']}")
-        print(f"Already accessible: {results['already_accessible']}")
-        print(f"Attempted activation: {results['attempted_activation']}")
-        print(f"Successful activations: {results['successful_activations']}")
-        print(f"Failed activations: {results['failed_activations']}")
+        lines = [
+            "",
+            "="*50,
+            "BEDROCK MODEL ACTIVATION SUMMARY",
+            "="*50,
+            f"Region: {self.region_name}",
+            f"Total models found: {results['total_models']}",
+            f"Skipped LEGACY models: {results['legacy_models']}",
+            f"Filtered models (ON_DEMAND/INFERENCE_PROFILE, excluding LEGACY): {results['filtered_models']}",
+            f"Already accessible: {results['already_accessible']}",
+            f"Skipped (availability check failed): {results['unchecked']}",
+            f"Attempted activation: {results['attempted_activation']}",
+            f"Successful activations: {results['successful_activations']}",
+            f"Failed activations: {results['failed_activations']}",
+        ]
 
         if results['activation_details']:
-            print("\nACTIVATION DETAILS:")
-            print("-" * 30)
+            lines.append("\nACTIVATION DETAILS:")
+            lines.append("-" * 30)
             for detail in results['activation_details']:
                 status_symbol = "✓" if detail['status'] == 'success' else "✗"
-                print(f"{status_symbol} {detail['model_name']} ({detail['model_id']})")
+                lines.append(f"{status_symbol} {detail['model_name']} ({detail['model_id']})")
                 if detail['status'] == 'failed':
-                    print(f"   Reason: {detail['reason']}")
+                    lines.append(f"   Reason: {detail['reason']}")
+
+        lines.append("="*50)
 
-        print("="*50)
+        # Write the whole summary at once instead of one print() per line
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 
 def main():
@@ -287,7 +577,7 @@ def main():
         activator.print_summary(results)
 
     except Exception as e:
-        logger.error(f"Fatal error during model activation: {e}")
+        logger.error("Fatal error during model activation: %s", e)
         print(f"Error: {e}")
 
 